@@ -1,3 +1,4 @@
+from copy import copy
 from typing import Callable, Union
 from rocketry.conditions.scheduler import SchedulerStarted
 from rocketry.conditions.task.task import DependFailure, DependFinish, DependSuccess, TaskFailed, TaskFinished, TaskRunnable, TaskStarted, TaskSucceeded
@@ -24,6 +25,8 @@ class TimeCondWrapper(BaseCondition):
         self._cls_cond = cls_cond
         self._cls_period = cls_period
         self._cond_kwargs = kwargs
+        # Built once as the wrapper is observed on every check
+        self._cond = self._get_cond(self._cls_period(None, None))
 
     def between(self, start, end):
         period = self._cls_period(start, end)
@@ -51,13 +54,11 @@ class TimeCondWrapper(BaseCondition):
         return self._get_cond(period)
 
     def observe(self, **kwargs):
-        cond = self.get_cond()
-        return cond.observe(**kwargs)
+        return self._cond.observe(**kwargs)
 
     def get_cond(self):
         "Get condition the wrapper itself represents"
-        period = self._cls_period(None, None)
-        return self._get_cond(period)
+        return copy(self._cond)
 
     def _get_cond(self, period):
         return self._cls_cond(period=period, **self._cond_kwargs)
@@ -67,10 +68,11 @@ class TimeActionWrapper(BaseCondition):
     def __init__(self, cls_cond, task=None):
         self.cls_cond = cls_cond
         self.task = task
+        # Built once as the wrapper is observed on every check
+        self._cond = cls_cond(task=task)
 
     def observe(self, **kwargs):
-        cond = self.get_cond()
-        return cond.observe(**kwargs)
+        return self._cond.observe(**kwargs)
 
     def __call__(self, task):
         return TimeActionWrapper(self.cls_cond, task=task)
@@ -104,7 +106,7 @@ class TimeActionWrapper(BaseCondition):
 
     def get_cond(self):
         "Get condition the wrapper represents"
-        return self.cls_cond(task=self.task)
+        return copy(self._cond)
 
 # Basics
 # ------
@@ -42,9 +42,22 @@ class DependMixin(BaseCondition):
         actual_task = session[self.task] if self.task is not None else task
         depend_task = session[self.depend_task]
 
-        #! TODO: use Task._last_success & Task._last_run if not none and not forced
-        last_depend_finish = depend_task.logger.get_latest(action=in_(self._dep_actions))
-        last_actual_start = actual_task.logger.get_latest(action="run")
+        if session.config.force_status_from_logs:
+            last_depend_finish = depend_task.logger.get_latest(action=in_(self._dep_actions))
+            last_actual_start = actual_task.logger.get_latest(action="run")
+            if last_depend_finish:
+                last_depend_finish = get_field_value(last_depend_finish, "created")
+            if last_actual_start:
+                last_actual_start = get_field_value(last_actual_start, "created")
+        else:
+            # Use the cached times (updated whenever the tasks log)
+            # so that the logs need not to be read every check
+            times = [
+                getattr(depend_task, f"last_{action}")
+                for action in self._dep_actions
+            ]
+            last_depend_finish = max((dt for dt in times if dt is not None), default=None)
+            last_actual_start = actual_task.last_run
 
         if not last_depend_finish:
             # Depend has not run at all
@@ -53,7 +66,7 @@ class DependMixin(BaseCondition):
             # Depend has succeeded but the actual task has not
             return True
             
-        return get_field_value(last_depend_finish, "created") > get_field_value(last_actual_start, "created")
+        return last_depend_finish > last_actual_start
 
 class TaskStatusMixin(BaseComparable):
 
@@ -1,5 +1,6 @@
 from copy import copy
 import datetime
+import operator
 from abc import abstractmethod
 from typing import Callable, Dict, Pattern, Union, Type
 
@@ -270,6 +271,11 @@ class AlwaysFalse(BaseCondition):
 class BaseComparable(BaseCondition):
 
     _comp_attrs = ("__eq__", "__ne__", "__lt__", "__gt__", "__le__", "__ge__")
+    _comp_funcs = {
+        "__eq__": operator.eq, "__ne__": operator.ne,
+        "__lt__": operator.lt, "__gt__": operator.gt,
+        "__le__": operator.le, "__ge__": operator.ge,
+    }
 
     def __init__(self):
         self._comps = {}
@@ -295,10 +301,12 @@ class BaseComparable(BaseCondition):
 
         if not compares:
             return res > 0
-        return all(
-            getattr(res, comp)(val) # Comparison is magic method (==, !=, etc.)
-            for comp, val in compares.items()
-        )
+        comp_funcs = self._comp_funcs
+        for comp, val in compares.items():
+            # Comparison is magic method (==, !=, etc.)
+            if not comp_funcs[comp](res, val):
+                return False
+        return True
 
     def _is_any_over_zero(self):
         # Useful for optimization: just find any observation and the statement is true
@@ -312,12 +320,14 @@ class BaseComparable(BaseCondition):
         return not comps
 
     def _is_equal_zero(self):
+        # Useful for optimization: the statement is true only if there are no observations
+        # (the measurement is a count thus "<= 0" and "< 1" are the same as "== 0")
         comps = {
             comp: self._comps[comp]
             for comp in self._comp_attrs
             if comp in self._comps
         }
-        return comps == {"__eq__": 0}
+        return comps == {"__eq__": 0} or comps == {"__le__": 0} or comps == {"__lt__": 1}
 
     def __eq__(self, other):
         # self == other
@@ -350,7 +360,9 @@ class BaseComparable(BaseCondition):
 
     def _set_comparison(self, key, val):
         obj = copy(self)
-        obj._comps[key] = val
+        # The copy is shallow thus the comparisons
+        # are copied to not modify the original
+        obj._comps = {**self._comps, key: val}
         return obj
 
     @classmethod
@@ -5,6 +5,9 @@ import inspect
 class _Hooker:
     # No, this is not what you think.
 
+    # Created for each run and cycle
+    __slots__ = ("args", "kwargs", "hooks", "_post_hooks")
+
     def __init__(self, hooks:List[Callable], args:Tuple=None, kwargs:Dict=None):
         self.args = () if args is None else args
         self.kwargs = {} if kwargs is None else kwargs
@@ -75,6 +75,9 @@ class TaskAdapter(logging.LoggerAdapter):
         for handler in handlers:
             repo = getattr(handler, 'repo', None)
             if repo is not None:
+                # Make sure buffered records (if any)
+                # are in the repo before reading
+                handler.flush()
                 return repo
         else:
             raise AttributeError(f"Logger '{self.logger.name}' has no handlers with repository. Cannot be read.")
@@ -1,9 +1,10 @@
 
 
 from collections.abc import Mapping
-from typing import Callable, Type, Union, TYPE_CHECKING
+from typing import Callable, Dict, Type, Union, TYPE_CHECKING
 from functools import partial
 import inspect
+import weakref
 
 from rocketry._base import RedBase
 from .arguments import BaseArgument
@@ -13,6 +14,17 @@ from rocketry.core.utils import filter_keyword_args
 if TYPE_CHECKING:
     import rocketry
 
+# Arguments in the signatures of the functions
+# (cached as inspecting the signature is slow)
+_signature_args: 'weakref.WeakKeyDictionary[Callable, Dict[str, BaseArgument]]' = weakref.WeakKeyDictionary()
+
+def _get_signature_args(func:Callable) -> Dict[str, BaseArgument]:
+    return {
+        name: param.default
+        for name, param in inspect.signature(func).parameters.items()
+        if isinstance(param.default, BaseArgument)
+    }
+
 class Parameters(RedBase, Mapping): # Mapping so that mytask(**Parameters(...)) would work
     """Parameter set for tasks.
 
@@ -53,13 +65,19 @@ class Parameters(RedBase, Mapping): # Mapping so that mytask(**Parameters(...))
         # Get parameters from a function signature
         # ie.
         # def myfunc(task=Task(), session=Session()): ...
-        func_params = inspect.signature(__func).parameters
-        params = cls()
-        for name, param in func_params.items():
-            default = param.default
-            if isinstance(default, BaseArgument):
-                params[name] = default
-        return params
+
+        # Bound methods are created on each access thus
+        # the underlying function is the key
+        func = getattr(__func, "__func__", __func)
+        try:
+            args = _signature_args[func]
+        except KeyError:
+            args = _get_signature_args(__func)
+            _signature_args[func] = args
+        except TypeError:
+            # Cannot be cached (not hashable or weak referable)
+            args = _get_signature_args(__func)
+        return cls(args)
 
 # For mapping interface
     def get(self, item, default=None):
@@ -116,6 +134,14 @@ class Parameters(RedBase, Mapping): # Mapping so that mytask(**Parameters(...))
         "Set parameter value"
         self._params[key] = item
 
+    def __delitem__(self, key):
+        "Remove parameter"
+        del self._params[key]
+
+    def pop(self, key, *default):
+        "Remove parameter and return its (unmaterialized) value"
+        return self._params.pop(key, *default)
+
     def update(self, params):
         params = params._params if isinstance(params, Parameters) else params
         self._params.update(params)
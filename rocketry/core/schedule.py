@@ -168,12 +168,14 @@ class Scheduler(RedBase):
         terminated.
         """
         tasks = self.tasks
-        self.logger.debug(f"Beginning cycle with {len(tasks)} tasks...", extra={"action": "run"})
+        self.logger.debug("Beginning cycle with %d tasks...", len(tasks), extra={"action": "run"})
 
         # Running hooks
         hooker = _Hooker(self.session.hooks.scheduler_cycle)
         hooker.prerun(self)
 
+        # One clock read serves the timeout checks of the cycle
+        now = datetime.datetime.fromtimestamp(time.time())
         for task in tasks:
             with task.lock:
                 self.handle_logs()
@@ -185,7 +187,9 @@ class Scheduler(RedBase):
                     await self.run_task(task)
                     # Reset force_run as a run has forced
                     task.force_run = False
-                elif self.is_timeouted(task):
+                    # The run may have taken a while (ie. on main)
+                    now = datetime.datetime.fromtimestamp(time.time())
+                elif self.is_timeouted(task, now=now):
                     # Terminate the task
                     await self.terminate_task(task, reason="timeout")
                 elif self.is_out_of_condition(task):
@@ -213,8 +217,6 @@ class Scheduler(RedBase):
 
     async def run_task(self, task:Task, *args, **kwargs):
         """Run a given task"""
-        start_time = datetime.datetime.fromtimestamp(time.time())
-
         try:
             await task.start_async(log_queue=self._log_queue)
         except (SchedulerRestart, SchedulerExit) as exc:
@@ -234,7 +236,7 @@ class Scheduler(RedBase):
 
     async def terminate_task(self, task, reason=None):
         """Terminate a given task."""
-        self.logger.debug(f"Terminating task '{task.name}'")
+        self.logger.debug("Terminating task '%s'", task.name)
         is_threaded = hasattr(task, "_thread")
         is_multiprocessed = hasattr(task, "_process")
         if task.is_alive_as_thread():
@@ -261,8 +263,16 @@ class Scheduler(RedBase):
             # The process/thread probably just died after the check
             pass
 
-    def is_timeouted(self, task):
-        """Check if the task is timeouted."""
+    def is_timeouted(self, task, now:Optional[datetime.datetime]=None):
+        """Check if the task is timeouted.
+        
+        Parameters
+        ----------
+        task : Task
+            Task to check.
+        now : datetime.datetime, optional
+            Current time. Read from the clock if not given.
+        """
         #! TODO: Can this be put to the Task?
         if task.permanent_task:
             # Task is meant to be on all the time thus no reason to terminate due to timeout
@@ -281,7 +291,9 @@ class Scheduler(RedBase):
         
         if timeout is None:
             return False
-        run_duration = datetime.datetime.fromtimestamp(time.time()) - task.get_last_run()
+        if now is None:
+            now = datetime.datetime.fromtimestamp(time.time())
+        run_duration = now - task.get_last_run()
         return run_duration > timeout
 
     def is_task_runnable(self, task:Task):
@@ -323,13 +335,14 @@ class Scheduler(RedBase):
         """Handle the status queue and carries the logging on their behalf."""
         # TODO: This could be maybe done in the tasks
         queue = self._log_queue
+        logger_names = set()
         while True:
             try:
                 record = queue.get(block=False)
             except Empty:
                 break
             else:
-                self.logger.debug(f"Inserting record for '{record.task_name}' ({record.action})")
+                self.logger.debug("Inserting record for '%s' (%s)", record.task_name, record.action)
                 task = self.session[record.task_name]
                 if record.action == "fail":
                     # There is a caveat in logging 
@@ -353,6 +366,13 @@ class Scheduler(RedBase):
                     del record.__return__
                 
                 task.log_record(record)
+                logger_names.add(task.logger_name)
+
+        # Buffering handlers (ie. BufferedRepoHandler) write
+        # the records of the queue to the repo in one batch
+        for logger_name in logger_names:
+            for handler in logging.getLogger(logger_name).handlers:
+                handler.flush()
 
     async def _hibernate(self):
         """Go to sleep and wake up when next task can be executed."""
@@ -366,14 +386,14 @@ class Scheduler(RedBase):
         Starting up includes setting up attributes and
         running tasks that have ``on_startup`` as ``True``."""
         #self.setup_listener()
-        self.logger.info(f"Starting up...", extra={"action": "setup"})
+        self.logger.info("Starting up...", extra={"action": "setup"})
         hooker = _Hooker(self.session.hooks.scheduler_startup)
         hooker.prerun(self)
 
         self.n_cycles = 0
         self.startup_time = datetime.datetime.fromtimestamp(time.time())
 
-        self.logger.info(f"Beginning startup sequence...")
+        self.logger.info("Beginning startup sequence...")
         for task in self.tasks:
             if task.on_startup:
                 if isinstance(task.start_cond, AlwaysFalse) and not task.disabled: 
@@ -384,7 +404,7 @@ class Scheduler(RedBase):
                     await self.run_task(task)
 
         hooker.postrun()
-        self.logger.info(f"Setup complete.")
+        self.logger.info("Setup complete.")
 
     def has_free_processors(self) -> bool:
         """Whether the Scheduler has free processors to
@@ -451,7 +471,7 @@ class Scheduler(RedBase):
         tasks to finish their termination.
         """
         
-        self.logger.info(f"Beginning shutdown sequence...")
+        self.logger.info("Beginning shutdown sequence...")
         hooker = _Hooker(self.session.hooks.scheduler_shutdown)
         hooker.prerun(self)
 
@@ -466,7 +486,7 @@ class Scheduler(RedBase):
                 if self.is_task_runnable(task):
                     await self.run_task(task)
 
-        self.logger.info(f"Shutting down tasks...")
+        self.logger.info("Shutting down tasks...")
         await self._shut_down_tasks(traceback, exception)
 
         await self.wait_task_alive() # Wait till all tasks' threads and processes are dead
@@ -475,7 +495,7 @@ class Scheduler(RedBase):
         hooker.postrun()
 
         self.is_alive = False
-        self.logger.info(f"Shutdown completed. Good bye.")
+        self.logger.info("Shutdown completed. Good bye.")
         if isinstance(exception, SchedulerRestart):
             # Clean up finished, restart is finally
             # possible
@@ -487,7 +507,7 @@ class Scheduler(RedBase):
         process is started.
         """
         # https://stackoverflow.com/a/35874988
-        self.logger.debug(f"Restarting...", extra={"action": "restart"})
+        self.logger.debug("Restarting...", extra={"action": "restart"})
         python = sys.executable
 
         restarting = self.session.config.restarting
@@ -22,6 +22,7 @@ except ImportError: # pragma: no cover
     from typing_extensions import Literal
 
 from pydantic import BaseModel, Field, PrivateAttr, validator
+from redbird.oper import in_
 
 from rocketry._base import RedBase
 from rocketry.core.condition import BaseCondition, AlwaysFalse, All
@@ -34,6 +35,7 @@ from rocketry.exc import SchedulerRestart, SchedulerExit, TaskInactionException,
 from rocketry.core.meta import _register
 from rocketry.core.hook import _Hooker
 from rocketry.log import QueueHandler
+from rocketry.log.utils import get_field_value
 
 if TYPE_CHECKING:
     from rocketry import Session
@@ -41,6 +43,11 @@ if TYPE_CHECKING:
 
 _IS_WINDOWS = platform.system()
 
+# Shared default for start_cond and end_cond. The condition
+# is stateless and not exposed to the parser (which may set
+# _str) so one instance is enough for all the tasks.
+_ALWAYS_FALSE = AlwaysFalse()
+
 def _create_session():
     # To avoid circular imports
     from rocketry import Session
@@ -179,8 +186,8 @@ class Task(RedBase, BaseModel):
 
     parameters: Parameters = Parameters()
 
-    start_cond: Optional[BaseCondition] = AlwaysFalse() #! TODO: Create get_start_cond so that this could also be as string (lazily parsed)
-    end_cond: Optional[BaseCondition] = AlwaysFalse()
+    start_cond: Optional[BaseCondition] = None #! TODO: Create get_start_cond so that this could also be as string (lazily parsed)
+    end_cond: Optional[BaseCondition] = None
 
     on_startup: bool = False
     on_shutdown: bool = False
@@ -197,27 +204,28 @@ class Task(RedBase, BaseModel):
     _thread_terminate: threading.Event = PrivateAttr(default_factory=threading.Event)
     _lock: Optional[threading.Lock] = PrivateAttr(default_factory=threading.Lock)
     _async_task: Optional[asyncio.Task] = PrivateAttr(default=None)
+    _period_cache: Optional[Tuple[BaseCondition, Tuple[Tuple[str, bool], ...], TimePeriod]] = PrivateAttr(default=None)
 
     _mark_running = False
 
-    @validator('start_cond', pre=True)
+    @validator('start_cond', pre=True, always=True)
     def parse_start_cond(cls, value, values):
         from rocketry.parse.condition import parse_condition
         session = values['session']
         if isinstance(value, str):
             value = parse_condition(value, session=session)
         elif value is None:
-            value = AlwaysFalse()
+            return _ALWAYS_FALSE
         return copy(value)
 
-    @validator('end_cond', pre=True)
+    @validator('end_cond', pre=True, always=True)
     def parse_end_cond(cls, value, values):
         from rocketry.parse.condition import parse_condition
         session = values['session']
         if isinstance(value, str):
             value = parse_condition(value, session=session)
         elif value is None:
-            value = AlwaysFalse()
+            return _ALWAYS_FALSE
         return copy(value)
 
     @validator('logger_name', pre=True, always=True)
@@ -459,10 +467,11 @@ class Task(RedBase, BaseModel):
         if execution in ('main', 'async'):
             self.log_running()
         try:
-            if inspect.iscoroutinefunction(self.execute):
-                output = await self.execute(**params)
+            execute = self.execute
+            if inspect.iscoroutinefunction(execute):
+                output = await execute(**params)
             else:
-                output = self.execute(**params)
+                output = execute(**params)
 
             # NOTE: we process success here in case the process_success
             # fails (therefore task fails)
@@ -592,15 +601,22 @@ class Task(RedBase, BaseModel):
         # records end up in the main process to be logged properly. 
 
         basename = self.logger_name
-        # handler = logging.handlers.QueueHandler(queue)
-        handler = QueueHandler(queue)
 
         # Set the process logger
         logger = logging.getLogger(basename + "._process")
         logger.setLevel(logging.INFO)
         logger.propagate = False
-        logger.handlers = []
-        logger.addHandler(handler)
+        has_handler = False
+        for old_handler in list(logger.handlers):
+            if isinstance(old_handler, QueueHandler) and old_handler.queue is queue and not has_handler:
+                # Already logs to the queue, reused
+                has_handler = True
+                continue
+            # Closing so that files etc. are not left open
+            logger.removeHandler(old_handler)
+            old_handler.close()
+        if not has_handler:
+            logger.addHandler(QueueHandler(queue))
         try:
             self.logger_name = logger.name
         except:
@@ -756,18 +772,12 @@ class Task(RedBase, BaseModel):
         # We get the logger here to not flood with warnings if missing repo
         logger = self.logger
 
-        self.last_run = self._get_last_action("run", from_logs=True, logger=logger)
-        self.last_success = self._get_last_action("success", from_logs=True, logger=logger)
-        self.last_fail = self._get_last_action("fail", from_logs=True, logger=logger)
-        self.last_terminate = self._get_last_action("terminate", from_logs=True, logger=logger)
-        self.last_inaction = self._get_last_action("inaction", from_logs=True, logger=logger)
-        self.last_crash = self._get_last_action("crash", from_logs=True, logger=logger)
-
-        times = {
-            name: getattr(self, f"last_{name}")
-            for name in ('run', 'success', 'fail', 'terminate', 'inaction', 'crash')
-            if getattr(self, f"last_{name}") is not None
-        }
+        # The logs are read once for all of the actions
+        actions = ('run', 'success', 'fail', 'terminate', 'inaction', 'crash')
+        times = self._get_last_actions_from_log(actions, logger=logger)
+        for action in actions:
+            setattr(self, f"last_{action}", times.get(action))
+
         if times:
             status = max(
                 times, 
@@ -899,14 +909,16 @@ class Task(RedBase, BaseModel):
                 runtime = now - start_time if start_time is not None else None
                 extra = {"action": action, "start": start_time, "end": now, "runtime": runtime}
             
-            is_running_as_child = self.logger.name.endswith("._process")
+            is_running_as_child = self.logger_name.endswith("._process")
             if is_running_as_child and action == "success":
                 # If child process, the return value is passed via QueueHandler to the main process
                 # and it's handled then in Scheduler.
                 # Else the return value is handled in Task itself (__call__ & _run_as_thread)
                 extra["__return__"] = return_value
 
-            log_method = self.logger.exception if action == "fail" else self.logger.info
+            # Task.logger creates a new adapter thus we get it only once
+            logger = self.logger
+            log_method = logger.exception if action == "fail" else logger.info
             log_method(
                 message, 
                 extra=extra
@@ -979,6 +991,29 @@ class Task(RedBase, BaseModel):
             timestamp = record["created"] if isinstance(record, dict) else record.created
             return timestamp
 
+    def _get_last_actions_from_log(self, actions:Tuple[str, ...], logger=None) -> Dict[str, datetime.datetime]:
+        """Get last timestamps of multiple actions from log
+        (reading the log only once)"""
+        logger = logger if logger is not None else self.logger
+        try:
+            records = logger.filter_by(action=in_(list(actions))).query()
+        except AttributeError:
+            if is_main_subprocess():
+                for action in actions:
+                    warnings.warn(f"Task '{self.name}' logger is not readable. Latest {action} unknown.")
+            return {}
+
+        times = {}
+        for record in records:
+            # Records are in the same order as get_latest uses thus
+            # the latest record of each action is left last
+            action = get_field_value(record, "action")
+            times[action] = get_field_value(record, "created")
+        return {
+            action: datetime.datetime.fromtimestamp(timestamp) if isinstance(timestamp, float) else timestamp
+            for action, timestamp in times.items()
+        }
+
     def __getstate__(self):
 
         # # capture what is normally pickled
@@ -1007,6 +1042,7 @@ class Task(RedBase, BaseModel):
         priv_attrs['_process'] = None
         priv_attrs['_thread'] = None
         priv_attrs['_thread_terminate'] = None
+        priv_attrs['_period_cache'] = None
 
         # We also get rid of the conditions as if there is a task
         # containing an attr that cannot be pickled (like FuncTask
@@ -1046,7 +1082,7 @@ class Task(RedBase, BaseModel):
     def delete(self):
         """Delete the task from the session. 
         Overried if needed additional cleaning."""
-        self.session.tasks.remove(self)
+        self.session.remove_task(self)
 
     def terminate(self):
         "Terminate this task"
@@ -1063,21 +1099,65 @@ class Task(RedBase, BaseModel):
         Note that this should not be considered as absolute truth but
         as a best estimate.
         """
+        # The period is derived from the start_cond thus
+        # it is determined only when the condition changes
+        # (and the tasks it refers to are the same in the session)
+        cond = self.start_cond
+        cached = self._period_cache
+        if cached is not None:
+            cached_cond, task_checks, period = cached
+            if cached_cond is cond and self._is_same_tasks(task_checks):
+                return period
+
+        task_checks = []
+        period = self._get_period(cond, task_checks)
+        self._period_cache = (cond, tuple(task_checks), period)
+        return period
+
+    def _is_same_tasks(self, task_checks) -> bool:
+        "Check the tasks are still (or still not) this task in the session"
+        session = self.session
+        try:
+            return all(
+                (session[task] is self) is is_self
+                for task, is_self in task_checks
+            )
+        except KeyError:
+            return False
+
+    def _get_period(self, cond:BaseCondition, task_checks:list) -> TimePeriod:
         from rocketry.core.time import StaticInterval, All as AllTime
         from rocketry.conditions import TaskFinished, TaskSucceeded
 
-        cond = self.start_cond
         session = self.session
 
-        if isinstance(cond, (TaskSucceeded, TaskFinished)):
-            if session[cond.kwargs["task"]] is self:
-                return cond.period
+        def is_self(task):
+            if task is None:
+                # Condition without task is observed with this task
+                return True
+            # The checks are recorded as the tasks
+            # in the session may change
+            result = session[task] is self
+            task_checks.append((task, result))
+            return result
+
+        def is_task_period(cond):
+            # Status conditions without a period do not determine one
+            return (
+                isinstance(cond, (TaskSucceeded, TaskFinished))
+                and cond.period is not None
+                and is_self(cond.task)
+            )
+
+        if is_task_period(cond):
+            return cond.period
 
         elif isinstance(cond, All):
-            task_periods = []
-            for sub_stmt in cond:
-                if isinstance(sub_stmt, (TaskFinished, TaskFinished)) and session[sub_stmt.kwargs["task"]] is self:
-                    task_periods.append(sub_stmt.period)
+            task_periods = [
+                sub_stmt.period
+                for sub_stmt in cond
+                if is_task_period(sub_stmt)
+            ]
             if task_periods:
                 return AllTime(*task_periods)
         
@@ -1,5 +1,6 @@
 import datetime
 from functools import reduce
+import operator
 import time
 from abc import abstractmethod
 from typing import Callable, ClassVar, Dict, FrozenSet, List, Optional, Pattern, Set, Union
@@ -329,7 +330,7 @@ class All(TimePeriod):
         ]
         all_overlaps = all(a.overlaps(b) for a, b in itertools.combinations(intervals, 2))
         if all_overlaps:
-            return reduce(lambda a, b: a & b, intervals)
+            return reduce(operator.and_, intervals)
         else:
             # Not found, trying again with next period
             # Example:
@@ -363,7 +364,7 @@ class All(TimePeriod):
         ]
         all_overlaps = all(a.overlaps(b) for a, b in itertools.combinations(intervals, 2))
         if all_overlaps:
-            return reduce(lambda a, b: a & b, intervals)
+            return reduce(operator.and_, intervals)
         else:
             # Not found, trying again with next period
             # Example:
@@ -1,2 +1,2 @@
-from .handlers import QueueHandler
+from .handlers import QueueHandler, BufferedRepoHandler
 from .log_record import MinimalRecord, LogRecord, TaskLogRecord
\ No newline at end of file
@@ -1,8 +1,14 @@
 from logging.handlers import QueueHandler as _QueueHandler
 from logging import Formatter
+import logging
+import time
+from typing import Optional
 
 import copy
 
+from redbird.logging import RepoHandler
+from redbird.repos import CSVFileRepo
+
 # Copying the default formatter mechanism from logging
 _DEFAULT_FORMATTER = Formatter()
 
@@ -44,3 +50,125 @@ class QueueHandler(_QueueHandler):
         record.exc_info = None
         # record.exc_text = None
         return record
+
+class BufferedRepoHandler(RepoHandler):
+    """Log handler that writes log records to a repository
+    in batches.
+
+    The records are collected to a buffer and written to the
+    repository when the buffer is full, when a record with
+    ``flush_level`` or higher is emitted, when ``flush_interval``
+    seconds have passed since the previous write, when the 
+    scheduler has handled the logs of the process tasks or 
+    when the logs are read via :py:class:`rocketry.core.log.TaskAdapter`.
+    Useful for repositories that are slow to write one record 
+    at a time, such as ``CSVFileRepo``.
+
+    Parameters
+    ----------
+    repo : BaseRepo
+        Repository where the log records are written
+    capacity : int, default=1000
+        Maximum number of records held in the buffer.
+    flush_interval : float, optional
+        Maximum time (in seconds) the records are held
+        in the buffer before the next emitted record
+        writes them to the repository. If None, only 
+        the capacity limits buffering. By default 1.0
+    flush_level : int, default=logging.ERROR
+        Level of a log record that causes immediate
+        write of the buffer.
+    **kwargs : dict
+        Keyword arguments passed to logging.Handler
+        init
+
+    Notes
+    -----
+    The records are turned to the repository's items
+    when emitted thus invalid records fail when logged.
+    The records that could not be written are kept
+    in the buffer.
+
+    Reading ``handler.repo`` directly may not include 
+    the records still in the buffer. Call ``handler.flush()``
+    before querying the repository yourself.
+    """
+
+    def __init__(self, repo, capacity:int=1000, flush_interval:Optional[float]=1.0, flush_level:int=logging.ERROR, **kwargs):
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.buffer = []
+        self._last_flush = time.monotonic()
+        super().__init__(repo=repo, **kwargs)
+
+    def write(self, record:dict):
+        "Put a log record to the buffer"
+        # Converting now so that invalid records fail 
+        # when logged (like with RepoHandler)
+        item = self.repo.to_item(record)
+        self.buffer.append(item)
+        if self.should_flush(record):
+            self.flush()
+
+    def should_flush(self, record:dict) -> bool:
+        "Check whether the buffer should be written to the repository"
+        if len(self.buffer) >= self.capacity:
+            return True
+        elif record.get("levelno", logging.NOTSET) >= self.flush_level:
+            return True
+        elif self.flush_interval is not None:
+            return time.monotonic() - self._last_flush >= self.flush_interval
+        return False
+
+    def flush(self):
+        "Write the buffered log records to the repository"
+        self.acquire()
+        try:
+            records = self.buffer
+            self.buffer = []
+            self._last_flush = time.monotonic()
+            try:
+                self._write_records(records)
+            except:
+                # Keeping the records that were not written
+                self.buffer = records + self.buffer
+                raise
+        finally:
+            self.release()
+
+    def _write_records(self, records:list):
+        "Write the items to the repository (removed from the list once written)"
+        repo = self.repo
+        if type(repo) is CSVFileRepo and repo.id_field is None:
+            # CSVFileRepo opens the file for each item thus
+            # we append all of the items with one open. The
+            # id check (if id_field) requires reading the file
+            # thus those are written one by one. Subclasses
+            # may override the writing thus not used for them.
+            if not records:
+                return
+            if not (repo.filename.exists() and repo.filename.stat().st_size > 0):
+                repo.create(if_exists="ignore")
+            with open(repo.filename, "a", newline="") as file:
+                writer = repo.get_writer(file)
+                writer.writerows(
+                    repo.item_to_dict(item, exclude_unset=False)
+                    for item in records
+                )
+            records.clear()
+        else:
+            for i, item in enumerate(records):
+                try:
+                    repo.add(item)
+                except:
+                    del records[:i]
+                    raise
+            records.clear()
+
+    def close(self):
+        "Write the remaining records and close the handler"
+        try:
+            self.flush()
+        finally:
+            super().close()
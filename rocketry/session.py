@@ -181,6 +181,7 @@ class Session(RedBase):
         self.parameters = self._get_parameters(parameters)
         self.scheduler = Scheduler(self)
         self.tasks = set()
+        self._task_index: Dict[str, 'Task'] = {} # Task names to tasks, used by __getitem__
         self.hooks = Hooks()
         self.returns = self._get_parameters(None)
         self._cond_parsers = self._cls_cond_parsers.copy()
@@ -192,8 +193,16 @@ class Session(RedBase):
     def __getitem__(self, task:Union['Task', str]):
         "Get a task from the session"
         task_name = self._get_task_name(task)
+
+        # Look up by name first. The tasks can be renamed or
+        # removed directly from the set thus the hit is verified.
+        task = self._task_index.get(task_name)
+        if task is not None and task.name == task_name and task in self.tasks:
+            return task
+
         for task in self.tasks:
             if task.name == task_name:
+                self._task_index[task_name] = task
                 return task
         else:
             raise KeyError(f"Task '{task_name}' not found")
@@ -378,14 +387,22 @@ class Session(RedBase):
                 raise KeyError(f"Task '{task.name}' already exists")
         else:
             self.tasks.add(task)
+        self._task_index[task.name] = task
         
         # Adding the session to the task
         task.session = self
 
     def remove_task(self, task: Union['Task', str]):
+        "Remove the task from the session"
         if isinstance(task, str):
             task = self[task]
-        self.session.tasks.remove(task)
+        self.tasks.remove(task)
+
+        # Not holding references to the removed task
+        # so it can be garbage collected
+        self.returns.pop(task, None)
+        if self._task_index.get(task.name) is task:
+            del self._task_index[task.name]
 
     def task_exists(self, task: 'Task'):
         warnings.warn((
@@ -471,6 +488,7 @@ class Session(RedBase):
         from rocketry.core import Parameters
 
         self.tasks = set()
+        self._task_index = {}
         self.parameters = Parameters()
 
     def __getstate__(self):
@@ -478,6 +496,7 @@ class Session(RedBase):
         # the task.session. Therefore removing unpicklable here.
         state = self.__dict__.copy()
         state["tasks"] = set()
+        state["_task_index"] = {}
         state["_cond_cache"] = None
         state["_cond_parsers"] = None
         state["session"] = None
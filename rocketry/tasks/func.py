@@ -2,7 +2,6 @@
 from os import stat_result
 import sys
 import inspect
-import importlib
 from pathlib import Path
 from typing import Callable, List, Optional
 import warnings
@@ -25,6 +24,8 @@ def get_module(path, pkg_path=None):
     else:
         name = Path(path).name
 
+    # Only needed when actually importing a script
+    import importlib.util
     spec = importlib.util.spec_from_file_location(name, path.absolute())
     task_module = importlib.util.module_from_spec(spec)
 
@@ -40,6 +41,7 @@ def to_import_path(src:stat_result):
 
 class TempSysPath:
     # TODO: To utils.
+    __slots__ = ("paths",)
     sys_path = sys.path
     def __init__(self, paths:list):
         self.paths = paths
@@ -126,7 +126,9 @@ def test_task_status(tmpdir, session, cls, succeeding, expected):
             id="DependFailure"),
     ],
 )
-def test_task_depend_fail(tmpdir, session, cls, expected):
+@pytest.mark.parametrize("from_logs", [pytest.param(True, id="from logs"), pytest.param(False, id="optimized")])
+def test_task_depend_fail(tmpdir, session, cls, expected, from_logs):
+    session.config.force_status_from_logs = from_logs
     # Going to tempdir to dump the log files there
     with tmpdir.as_cwd() as old_dir:
         condition = cls(task="runned task", depend_task="prerequisite task")
@@ -194,7 +196,9 @@ def test_task_depend_fail(tmpdir, session, cls, expected):
             id="DependFailure"),
     ],
 )
-def test_task_depend_success(tmpdir, session, cls, expected):
+@pytest.mark.parametrize("from_logs", [pytest.param(True, id="from logs"), pytest.param(False, id="optimized")])
+def test_task_depend_success(tmpdir, session, cls, expected, from_logs):
+    session.config.force_status_from_logs = from_logs
     # Going to tempdir to dump the log files there
     with tmpdir.as_cwd() as old_dir:
         condition = cls(task="runned task", depend_task="prerequisite task")
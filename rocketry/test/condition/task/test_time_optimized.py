@@ -118,7 +118,14 @@ def test_logs_not_used_false_outside_period(session, cls, mock_datetime_now):
         TaskFailed, TaskSucceeded, TaskFinished, TaskStarted, TaskInacted, TaskTerminated
     ]
 )
-def test_logs_not_used_equal_zero(session, cls, mock_datetime_now):
+@pytest.mark.parametrize("get_cond",
+    [
+        pytest.param(lambda cond: cond == 0, id="== 0"),
+        pytest.param(lambda cond: cond <= 0, id="<= 0"),
+        pytest.param(lambda cond: cond < 1, id="< 1"),
+    ]
+)
+def test_logs_not_used_equal_zero(session, cls, get_cond, mock_datetime_now):
     session.config.force_status_from_logs = False
     
     task = FuncTask(
@@ -132,7 +139,7 @@ def test_logs_not_used_equal_zero(session, cls, mock_datetime_now):
         for state in ("success", "fail", "run", "terminate", "inaction")
     ]
     setup_task_state(mock_datetime_now, logs, task=task)
-    cond = cls(task=task) == 0
+    cond = get_cond(cls(task=task))
     assert cond.observe(session=session)
 
 @pytest.mark.parametrize("cls",
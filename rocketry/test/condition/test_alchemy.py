@@ -33,4 +33,22 @@ from rocketry.conds import true, false
 def test_nested(actual, expected):
     expected = expected()
     actual = actual()
-    assert expected == actual
\ No newline at end of file
+    assert expected == actual
+
+def test_chained_stays_flat():
+    # Extending a condition repeatedly should not nest
+    # the containers (evaluated as one short-circuiting node)
+    cond = true
+    for _ in range(5):
+        cond &= false
+    assert type(cond) is All
+    assert len(cond.subconditions) == 6
+    assert all(not isinstance(sub, All) for sub in cond)
+    assert not cond.observe()
+
+    cond = false
+    for _ in range(5):
+        cond |= true
+    assert type(cond) is Any
+    assert len(cond.subconditions) == 6
+    assert cond.observe()
@@ -1,4 +1,5 @@
 import pytest
+from rocketry.tasks import FuncTask
 from rocketry.conditions.scheduler import SchedulerStarted
 from rocketry.conditions.task.task import TaskFailed, TaskFinished, TaskRunning, TaskStarted, TaskSucceeded
 
@@ -128,3 +129,20 @@ def test_api(cond, result):
 def test_fail():
     with pytest.raises(ValueError):
         every("5 seconds", based="oops")
+
+@pytest.mark.parametrize("wrapper", [daily, time_of_day, failed, failed("a_task"), started("a_task").this_day])
+def test_wrapper_cond_reused(wrapper):
+    # The wrapped condition is not rebuilt on every observation
+    # but get_cond returns a new one
+    assert wrapper.get_cond() is not wrapper._cond
+    assert wrapper.get_cond() == wrapper._cond
+
+def test_wrapper_get_cond_compared(session):
+    task = FuncTask(lambda: None, name="a task", execution="main", session=session)
+    assert not failed.observe(task=task, session=session)
+
+    # Comparing on the got condition must not modify the wrapper
+    cond = failed.get_cond() == 0
+    assert cond.observe(task=task, session=session)
+    assert failed.get_cond()._comps == {}
+    assert not failed.observe(task=task, session=session)
@@ -7,6 +7,7 @@ from rocketry.conditions import (
 )
 from rocketry.conds import true, false
 from rocketry.time import TimeDelta
+from rocketry.core.condition import BaseComparable
 
 def test_true():
     assert bool(true)
@@ -102,4 +103,23 @@ def test_fail(get_cond,exc):
 )
 def test_representation(obj, string, represent):
     assert str(obj) == string
-    assert repr(obj) == represent
\ No newline at end of file
+    assert repr(obj) == represent
+
+@pytest.mark.parametrize(
+    "make_cond,expected",
+    [
+        pytest.param(lambda cond: cond, True, id="no comparison"),
+        pytest.param(lambda cond: cond == 3, True, id="=="),
+        pytest.param(lambda cond: cond != 3, False, id="!="),
+        pytest.param(lambda cond: cond > 2.5, True, id="> (float)"),
+        pytest.param(lambda cond: cond < 2.5, False, id="< (float)"),
+        pytest.param(lambda cond: (cond >= 3) & (cond <= 3), True, id=">= & <="),
+    ]
+)
+def test_comparable(make_cond, expected):
+    class Count(BaseComparable):
+        def get_measurement(self):
+            return 3
+
+    cond = make_cond(Count())
+    assert cond.observe() is expected
@@ -55,6 +55,28 @@ def test_from_func(session):
     assert "a_param" in session.parameters
     assert session.parameters.materialize() == {"a_param": 5}
 
+def test_from_signature():
+    from rocketry.args import Arg
+    arg = Arg("y")
+
+    def myfunc(x, y=arg, z=5):
+        ...
+
+    params = Parameters._from_signature(myfunc)
+    assert params._params == {"y": arg}
+
+    # Cached arguments are not modified by the returned parameters
+    params["x"] = 1
+    assert Parameters._from_signature(myfunc)._params == {"y": arg}
+
+    class MyClass:
+        def method(self, y=arg):
+            ...
+
+    # Each access creates a new bound method
+    assert Parameters._from_signature(MyClass().method)._params == {"y": arg}
+    assert Parameters._from_signature(MyClass().method)._params == {"y": arg}
+
 def test_func_param(session:rocketry.Session):
     @FuncParam()
     def my_param():
@@ -67,4 +67,15 @@ def test_update(a, b, union):
     b = b()
     union = union()
     a.update(b)
-    assert union.materialize() == a.materialize()
\ No newline at end of file
+    assert union.materialize() == a.materialize()
+
+def test_remove():
+    params = Parameters({"a": 0, "b": 1, "c": 2})
+    del params["a"]
+    assert params.pop("b") == 1
+    assert params.pop("b", None) is None
+    assert params.materialize() == {"c": 2}
+    with pytest.raises(KeyError):
+        del params["a"]
+    with pytest.raises(KeyError):
+        params.pop("a")
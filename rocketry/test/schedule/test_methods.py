@@ -6,14 +6,18 @@ executing one task)
 """
 
 import asyncio
+import logging
 import time
 
 import pytest
 
+from redbird.repos import MemoryRepo
+
 from rocketry.core import Scheduler
 from rocketry.tasks import FuncTask
 from rocketry.exc import TaskInactionException
 from rocketry.conditions import AlwaysFalse
+from rocketry.log import BufferedRepoHandler, MinimalRecord
 
 def run_failing():
     raise RuntimeError("Task failed")
@@ -58,4 +62,55 @@ def test_run_task(execution, task_func, run_count, fail_count, success_count, se
     scheduler.handle_logs()
 
     assert success_count == logger.filter_by(action="success").count()
-    assert fail_count == logger.filter_by(action="fail").count()
\ No newline at end of file
+    assert fail_count == logger.filter_by(action="fail").count()
+
+def make_record(task_name, action="run"):
+    return logging.makeLogRecord({
+        "task_name": task_name, "action": action, 
+        "created": time.time(), "msg": f"Status: {action}",
+        "levelno": logging.INFO, "levelname": "INFO",
+    })
+
+def handle_logs_until(scheduler, is_done, timeout=5):
+    # Putting to the queue is done in a thread thus
+    # the records may not be available right away
+    end = time.time() + timeout
+    while not is_done():
+        assert time.time() < end, "Records not handled"
+        scheduler.handle_logs()
+
+def test_handle_logs_failing_record(session):
+    task = FuncTask(func=run_succeeding, name="task", start_cond=AlwaysFalse(), execution="main", session=session)
+    scheduler = Scheduler(session=session)
+
+    scheduler._log_queue.put(make_record("removed task"))
+    scheduler._log_queue.put(make_record("task"))
+    while scheduler._log_queue.empty():
+        time.sleep(0.001)
+
+    with pytest.raises(KeyError):
+        scheduler.handle_logs()
+
+    # Remaining records are not lost
+    handle_logs_until(scheduler, lambda: task.logger.filter_by(action="run").count() == 1)
+    assert task.status == "run"
+
+def test_handle_logs_buffered(session):
+    repo = MemoryRepo(model=MinimalRecord)
+    handler = BufferedRepoHandler(repo=repo, flush_interval=None)
+    task_logger = logging.getLogger(session.config.task_logger_basename)
+    task_logger.handlers = [handler]
+
+    task = FuncTask(func=run_succeeding, name="task", start_cond=AlwaysFalse(), execution="main", session=session)
+    scheduler = Scheduler(session=session)
+
+    for action in ("run", "success", "run"):
+        record = make_record("task", action=action)
+        record.__return__ = None
+        scheduler._log_queue.put(record)
+
+    # The handled records are written to the repo
+    # (without reading them via the task's logger)
+    handle_logs_until(scheduler, lambda: len(repo.filter_by().all()) == 3)
+    assert handler.buffer == []
+    assert [record.action for record in repo.filter_by().all()] == ["run", "success", "run"]
@@ -1,7 +1,10 @@
 
+import gc
 import logging
+import weakref
 
 import pytest
+from rocketry import Session
 from rocketry.core.log.adapter import TaskAdapter
 from rocketry.tasks import FuncTask
 from rocketry.core import Parameters, Scheduler
@@ -68,6 +71,27 @@ def test_getitem(session):
     with pytest.raises(KeyError):
         session["non existing"]
 
+def test_getitem_modified(session):
+    task_1 = FuncTask(
+        lambda : None, 
+        name="task 1",
+        execution="main",
+        session=session
+    )
+    assert session['task 1'] is task_1
+
+    # Renamed
+    task_1.name = "renamed"
+    assert session['renamed'] is task_1
+    with pytest.raises(KeyError):
+        session['task 1']
+
+    # Removed directly from the set
+    session.tasks.remove(task_1)
+    with pytest.raises(KeyError):
+        session['renamed']
+    assert "renamed" not in session
+
 def test_add(session):
     task = FuncTask(
         lambda : None, 
@@ -116,6 +140,24 @@ def test_remove(session):
     session.remove_task("task 2")
     assert session.tasks == {task_1}
 
+def test_remove_task_not_default(session):
+    other = Session()
+    assert other is not session.session
+    task = FuncTask(lambda : None, name="task 1", execution="main", session=other)
+    task()
+    assert task in other.returns
+
+    task_ref = weakref.ref(task)
+    other.remove_task("task 1")
+    assert other.tasks == set()
+    assert task not in other.returns
+    with pytest.raises(KeyError):
+        other["task 1"]
+
+    del task
+    gc.collect()
+    assert task_ref() is None
+
 # Old interface
 # -------------
 
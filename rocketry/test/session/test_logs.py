@@ -3,14 +3,15 @@ from itertools import chain
 import datetime
 import logging
 from typing import Optional
-from pydantic import Field, root_validator
+from pydantic import Field, ValidationError, root_validator
 
 import pytest
 
 from redbird.oper import in_, between
 from redbird.logging import RepoHandler
-from redbird.repos import MemoryRepo
+from redbird.repos import MemoryRepo, CSVFileRepo
 
+from rocketry.log import BufferedRepoHandler
 from rocketry.log.log_record import LogRecord, TaskLogRecord, MinimalRecord
 from rocketry.pybox.time.convert import to_datetime
 from rocketry.tasks import FuncTask
@@ -147,4 +148,176 @@ def test_get_logs_params(tmpdir, mock_pydatetime, mock_time, query, expected, se
             # Check all expected items in actual (actual can contain extra)
             for key, val in e.items():
                 assert a[key] == e[key]
-            # assert e.items() <= a.items()
\ No newline at end of file
+            # assert e.items() <= a.items()
+
+def test_buffered_handler(tmpdir, session):
+    with tmpdir.as_cwd() as old_dir:
+        repo = CSVFileRepo(filename="logs.csv", model=MinimalRecord)
+        handler = BufferedRepoHandler(repo=repo, flush_interval=None)
+        task_logger = logging.getLogger(session.config.task_logger_basename)
+        task_logger.handlers = [handler]
+
+        task = FuncTask(lambda: None, name="mytask", execution="main")
+        task.log_running()
+        task.log_success()
+
+        # Not yet written
+        assert len(handler.buffer) == 2
+        assert repo.filter_by().all() == []
+        # Held as the items of the repo
+        assert all(isinstance(item, MinimalRecord) for item in handler.buffer)
+
+        # Reading via the task's logger writes the buffer
+        records = task.logger.get_records()
+        assert [record.action for record in records] == ["run", "success"]
+        assert handler.buffer == []
+        assert len(repo.filter_by().all()) == 2
+
+        # Failures are written immediately
+        task.log_running()
+        task.log_failure()
+        assert handler.buffer == []
+        assert [record.action for record in repo.filter_by().all()] == ["run", "success", "run", "fail"]
+
+def test_buffered_handler_capacity(tmpdir, session):
+    with tmpdir.as_cwd() as old_dir:
+        repo = MemoryRepo(model=MinimalRecord)
+        handler = BufferedRepoHandler(repo=repo, capacity=3, flush_interval=None)
+        task_logger = logging.getLogger(session.config.task_logger_basename)
+        task_logger.handlers = [handler]
+
+        task = FuncTask(lambda: None, name="mytask", execution="main")
+        task.log_running()
+        task.log_success()
+        assert repo.filter_by().all() == []
+        task.log_running()
+        assert len(repo.filter_by().all()) == 3
+
+        task.log_success()
+        handler.close()
+        assert len(repo.filter_by().all()) == 4
+
+def test_buffered_handler_dict_model(session):
+    repo = MemoryRepo(model=dict)
+    handler = BufferedRepoHandler(repo=repo, flush_interval=None)
+    task_logger = logging.getLogger(session.config.task_logger_basename)
+    task_logger.handlers = [handler]
+
+    task = FuncTask(lambda: None, name="mytask", execution="main")
+    task.log_running()
+    # All fields are held as the repo may store them
+    assert {"task_name", "action", "created", "levelno", "msg"} <= set(handler.buffer[0])
+    handler.flush()
+    assert repo.filter_by().all()[0]["action"] == "run"
+
+def test_buffered_handler_full_record(session):
+    class LevelRecord(MinimalRecord):
+        level: str
+
+        @root_validator(pre=True)
+        def set_level(cls, values):
+            values["level"] = values["levelname"]
+            return values
+
+    repo = MemoryRepo(model=LevelRecord)
+    handler = BufferedRepoHandler(repo=repo, flush_interval=None)
+    task_logger = logging.getLogger(session.config.task_logger_basename)
+    task_logger.handlers = [handler]
+
+    task = FuncTask(lambda: None, name="mytask", execution="main")
+    # The model gets the same record as with RepoHandler
+    task.log_running()
+    handler.flush()
+    assert [record.level for record in repo.filter_by().all()] == ["INFO"]
+
+def test_buffered_handler_csv_batch(tmpdir, session, monkeypatch):
+    with tmpdir.as_cwd() as old_dir:
+        repo = CSVFileRepo(filename="logs.csv", model=MinimalRecord)
+        handler = BufferedRepoHandler(repo=repo, flush_interval=None)
+        task_logger = logging.getLogger(session.config.task_logger_basename)
+        task_logger.handlers = [handler]
+
+        def append_file(self, item):
+            raise AssertionError("Items should be appended in a batch")
+        monkeypatch.setattr(CSVFileRepo, "append_file", append_file)
+
+        task = FuncTask(lambda: None, name="mytask", execution="main")
+        for _ in range(3):
+            task.log_running()
+            # Invalid record does not drop the others
+            with pytest.raises(ValidationError):
+                task_logger.info("no task name", extra={"action": "run"})
+            task.log_success()
+        handler.flush()
+
+        assert [record.action for record in repo.filter_by().all()] == ["run", "success"] * 3
+        assert tmpdir.join("logs.csv").read().count("task_name") == 1
+
+def test_buffered_handler_invalid_record(session):
+    repo = MemoryRepo(model=MinimalRecord)
+    handler = BufferedRepoHandler(repo=repo, flush_interval=None)
+    task_logger = logging.getLogger(session.config.task_logger_basename)
+    task_logger.handlers = [handler]
+
+    task = FuncTask(lambda: None, name="mytask", execution="main")
+    task.log_running()
+
+    # Invalid record fails when logged and is not buffered
+    with pytest.raises(ValidationError):
+        task_logger.info("no task name", extra={"action": "run"})
+
+    task.log_success()
+    handler.flush()
+    assert [record.action for record in repo.filter_by().all()] == ["run", "success"]
+
+def test_buffered_handler_write_fails(session, monkeypatch):
+    repo = MemoryRepo(model=MinimalRecord)
+    handler = BufferedRepoHandler(repo=repo, flush_interval=None)
+    task_logger = logging.getLogger(session.config.task_logger_basename)
+    task_logger.handlers = [handler]
+
+    task = FuncTask(lambda: None, name="mytask", execution="main")
+    task.log_running()
+    task.log_success()
+    task.log_running()
+
+    orig_add = MemoryRepo.add
+    n_calls = []
+    def add(self, item, *args, **kwargs):
+        n_calls.append(item)
+        if len(n_calls) == 2:
+            raise OSError("Writing failed")
+        return orig_add(self, item, *args, **kwargs)
+    monkeypatch.setattr(MemoryRepo, "add", add)
+
+    with pytest.raises(OSError):
+        handler.flush()
+    # The records not written are kept
+    assert [record.action for record in repo.filter_by().all()] == ["run"]
+    assert [item.action for item in handler.buffer] == ["success", "run"]
+
+    handler.flush()
+    assert [record.action for record in repo.filter_by().all()] == ["run", "success", "run"]
+    assert handler.buffer == []
+
+def test_buffered_handler_csv_subclass(tmpdir, session):
+    appended = []
+    class MyRepo(CSVFileRepo):
+        def append_file(self, item):
+            appended.append(item)
+            super().append_file(item)
+
+    with tmpdir.as_cwd() as old_dir:
+        repo = MyRepo(filename="logs.csv", model=MinimalRecord)
+        handler = BufferedRepoHandler(repo=repo, flush_interval=None)
+        task_logger = logging.getLogger(session.config.task_logger_basename)
+        task_logger.handlers = [handler]
+
+        task = FuncTask(lambda: None, name="mytask", execution="main")
+        task.log_running()
+        task.log_success()
+        handler.flush()
+
+        # The subclass' own writing is used
+        assert [item.action for item in appended] == ["run", "success"]
+        assert [record.action for record in repo.filter_by().all()] == ["run", "success"]
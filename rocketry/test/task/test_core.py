@@ -21,6 +21,14 @@ def test_defaults(session):
     assert isinstance(task.start_cond, AlwaysFalse)
     assert isinstance(task.end_cond, AlwaysFalse)
 
+    # The default condition is shared, not created per task
+    task2 = DummyTask(name="mytest 2", session=session)
+    assert task.start_cond is task2.start_cond
+
+    task2.start_cond = AlwaysTrue()
+    task2.start_cond = None
+    assert isinstance(task2.start_cond, AlwaysFalse)
+
 def test_defaults_no_session(session):
     with pytest.warns(UserWarning):
         task = DummyTask(name="mytest")
@@ -127,3 +135,59 @@ def test_json(session):
     .replace("<RUN>", dt_run.strftime("%Y-%m-%dT%H:%M:%S"))
     .replace("<SUCCESS>", dt_success.strftime("%Y-%m-%dT%H:%M:%S"))
     )[1:-1]
+
+def test_period(session):
+    from rocketry.conditions import TaskStarted
+    from rocketry.core.time import StaticInterval
+    from rocketry.time import TimeOfDay
+
+    task = DummyTask(name="mytest", session=session)
+    assert task.period == StaticInterval()
+    assert task.period is task.period
+
+    # Changing the condition determines the period again
+    cached = task.period
+    task.start_cond = TaskStarted(period=TimeOfDay("12:00", "14:00"))
+    assert task.period == StaticInterval()
+    assert task.period is not cached
+
+def test_period_task_conditions(session):
+    from rocketry.conditions import TaskSucceeded, TaskStarted
+    from rocketry.core.time import StaticInterval, All
+    from rocketry.time import TimeOfDay
+
+    task = DummyTask(name="mytest", session=session)
+    period = TimeOfDay("10:00", "12:00")
+    task.start_cond = TaskSucceeded(task="mytest", period=period) == 0
+    assert task.period == period
+    assert task.period is task.period
+
+    # Without task, the condition is for the task itself
+    task.start_cond = TaskStarted(period=TimeOfDay("12:00", "14:00")) & (TaskSucceeded(period=period) == 0)
+    assert task.period == All(period)
+
+    # Condition of another task does not determine the period
+    other = DummyTask(name="other", session=session)
+    task.start_cond = TaskSucceeded(task="other", period=period)
+    assert task.period == StaticInterval()
+
+    # Cached period is not used if the other task became this task
+    session.remove_task(other)
+    task.name = "other"
+    assert task.period == period
+
+@pytest.mark.parametrize(
+    "start_cond",
+    [
+        pytest.param("has succeeded", id="succeeded"),
+        pytest.param("has finished", id="finished"),
+        pytest.param("has started & has succeeded", id="started & succeeded"),
+        pytest.param("has failed & has succeeded", id="failed & succeeded"),
+    ]
+)
+def test_period_task_conditions_without_period(session, start_cond):
+    from rocketry.core.time import StaticInterval
+
+    task = DummyTask(name="mytest", session=session, start_cond=start_cond)
+    assert task.period == StaticInterval()
+    assert not task.is_runnable()